@@ -1,7 +1,21 @@
 import sys
 
+from itertools import chain
+from itertools import islice
+from typing import Callable
+from typing import Iterable
+from typing import Sized
+
 from scraper import Types
 from scraper import IMDbScraper
+from scraper import Movie
+from scraper import Show
+
+# the number of rows used to size the name column when no fixed width is given
+SAMPLE_SIZE = 1000
+
+# the number of lines held in memory before they are written to stdout
+WRITE_CHUNK_SIZE = 500
 
 
 # parse the command line arguments
@@ -42,6 +56,31 @@ def get_args() -> tuple:
 
     return content_type, ranking_type, genre, votes, limit, filter
 
+# parse the command line arguments that control how the results are output
+def get_output_args() -> tuple:
+    name_width_index = sys.argv.index("--name-width") if "--name-width" in sys.argv else -1
+    name_width = int(sys.argv[name_width_index + 1]) if name_width_index != -1 else 0
+
+    limit_output_index = sys.argv.index("--limit-output") if "--limit-output" in sys.argv else -1
+    limit_output = int(sys.argv[limit_output_index + 1]) if limit_output_index != -1 else 0
+
+    page_index = sys.argv.index("--page") if "--page" in sys.argv else -1
+    page = int(sys.argv[page_index + 1]) if page_index != -1 else 1
+
+    if name_width < 0:
+        raise ValueError("invalid name width provided, the \"--name-width\" option must not be negative")
+
+    if limit_output_index != -1 and limit_output < 1:
+        raise ValueError("invalid output limit provided, the \"--limit-output\" option must be at least 1")
+
+    if page_index != -1 and limit_output_index == -1:
+        raise ValueError("invalid page provided, the \"--page\" option can only be used with the \"--limit-output\" option")
+
+    if page < 1:
+        raise ValueError("invalid page provided, the \"--page\" option must be at least 1")
+
+    return name_width, limit_output, page
+
 # if any valid filters are provided, print them
 def print_movie_filter_options(filter_options: tuple) -> None:
     year_filter, rating_filter, duration_filter, gross_filter = filter_options
@@ -86,77 +125,115 @@ def print_tv_show_filter_options(filters: tuple) -> None:
     else:
         print("Filter Options:", filter_string)
 
-# print the movies from the list in a table
-def print_movies(movies: list) -> None:
-    if movies:
-        # get the length of the longest name of a movie
-        max_length = max(len(movie.name) for movie in movies)
+# calculate the number of tab characters needed to maintain uniform spacing for a name column of the given width
+def get_tab_characters(name_width: int) -> int:
+    return (name_width // 8) + 1
+
+# pad a name shorter than the column width so that the column width is maintained
+def pad_name(name: str, tab_characters: int) -> str:
+    if (len(name) + 1) % 8 == 0:
+        return name + ("\t" * ((tab_characters - (len(name) // 8)) - 1))
+    else:
+        return name + ("\t" * (tab_characters - (len(name) // 8)))
+
+# write the rows of a table to stdout in chunks, sizing the name column from a bounded sample of the rows
+def print_table(rows: Iterable, format_headings: Callable, format_row: Callable, name_width: int, limit: int, page: int) -> bool:
+    # if the output is not limited and the rows are already in memory, size the name column from all of them
+    # so that every row fits in the column
+    if not name_width and not limit and isinstance(rows, Sized) and len(rows) > 0:
+        name_width = max(len(item.name) for item in rows)
+
+    rows = iter(rows)
+    first_row = (limit * (page - 1) if limit else 0) + 1
+
+    # only keep the rows on the requested page if the output is limited
+    if limit:
+        rows = islice(rows, limit * (page - 1), limit * page)
+
+    # only the sample is held in memory, any remaining rows are streamed after it
+    sample = list(islice(rows, min(limit, SAMPLE_SIZE) if limit else SAMPLE_SIZE))
+
+    if not sample:
+        return False
 
-        # calculate the number of tab characters needed to maintained uniform spacing
-        tab_characters = (max_length // 8) + 1
+    # otherwise get the length of the longest name in the sample if no fixed width is given,
+    # names longer than the column width will overflow it
+    if not name_width:
+        name_width = max(len(item.name) for item in sample)
 
-        # pad the header
-        name_header = "Name" + ("\t" * tab_characters)
+    tab_characters = get_tab_characters(name_width)
 
-        headings = f"\tRank\t {name_header} Year\t Rating Duration Cert.\t Votes\t Gross"
+    buffer = [format_headings(tab_characters), ""]
 
-        print(headings)
-        print()
+    for i, item in enumerate(chain(sample, rows), start=first_row):
+        buffer.append(format_row(i, item, tab_characters))
 
-        for i, movie in enumerate(movies):
-            # pad any movie names shorter than the longest so that the column width in maintained
-            if (len(movie.name) + 1) % 8 == 0:
-                name_string = movie.name + ("\t" * ((tab_characters - (len(movie.name) // 8)) - 1))
-            else:
-                name_string = movie.name + ("\t" * (tab_characters - (len(movie.name) // 8)))
+        # write the buffer once it is full so that memory use is bounded by the chunk size
+        if len(buffer) >= WRITE_CHUNK_SIZE:
+            sys.stdout.write("\n".join(buffer) + "\n")
+            buffer.clear()
 
-            # pad the number of votes with tab characters if it is too short
-            if len(str(movie.votes)) < 7:
-                votes_string = str(movie.votes) + "\t"
-            else:
-                votes_string = str(movie.votes)
+    if buffer:
+        sys.stdout.write("\n".join(buffer) + "\n")
 
-            # if the movie has a gross value, pre-pend it with a '$'
-            if movie.gross is not None:
-                gross_string = "$" + str(movie.gross)
-            else:
-                gross_string = str(movie.gross)
+    sys.stdout.flush()
+    return True
 
-            # print the movie information
-            print(f"{i + 1}.\t{movie.rank}\t {name_string} {movie.year}\t {movie.rating}\t{movie.duration}\t {movie.certificate}\t {votes_string} {gross_string}")
+def format_movie_headings(tab_characters: int) -> str:
+    # pad the header
+    name_header = "Name" + ("\t" * tab_characters)
+
+    return f"\tRank\t {name_header} Year\t Rating Duration Cert.\t Votes\t Gross"
+
+def format_movie_row(i: int, movie: Movie, tab_characters: int) -> str:
+    name_string = pad_name(movie.name, tab_characters)
+
+    # pad the number of votes with tab characters if it is too short
+    if len(str(movie.votes)) < 7:
+        votes_string = str(movie.votes) + "\t"
     else:
-        print("No Matches")
+        votes_string = str(movie.votes)
 
-def print_tv_shows(shows: list) -> None:
-    if shows:
-        # get the length of the longest name of a show
-        max_length = max(len(show.name) for show in shows)
+    # if the movie has a gross value, pre-pend it with a '$'
+    if movie.gross is not None:
+        gross_string = "$" + str(movie.gross)
+    else:
+        gross_string = str(movie.gross)
 
-        # calculate the number of tab characters needed to maintained uniform spacing
-        tab_characters = (max_length // 8) + 1
+    return f"{i}.\t{movie.rank}\t {name_string} {movie.year}\t {movie.rating}\t{movie.duration}\t {movie.certificate}\t {votes_string} {gross_string}"
 
-        # pad the header
-        name_header = "Name" + ("\t" * tab_characters)
+def format_tv_show_headings(tab_characters: int) -> str:
+    # pad the header
+    name_header = "Name" + ("\t" * tab_characters)
 
-        headings = f"\tRank\t {name_header} Start End\t Rating Cert.\t Discont. Votes"
+    return f"\tRank\t {name_header} Start End\t Rating Cert.\t Discont. Votes"
 
-        print(headings)
-        print()
+def format_tv_show_row(i: int, show: Show, tab_characters: int) -> str:
+    name_string = pad_name(show.name, tab_characters)
 
-        for i, show in enumerate(shows):
-            # pad any show names shorter than the longest so that the column width in maintained
-            if (len(show.name) + 1) % 8 == 0:
-                name_string = show.name + ("\t" * ((tab_characters - (len(show.name) // 8)) - 1))
-            else:
-                name_string = show.name + ("\t" * (tab_characters - (len(show.name) // 8)))
+    return f"{i}.\t{show.rank}\t {name_string} {show.year[0]}  {show.year[1]}\t {show.rating}\t {show.certificate}\t {show.discontinued}\t  {show.votes}"
 
-            # print the show information
-            print(f"{i + 1}.\t{show.rank}\t {name_string} {show.year[0]}  {show.year[1]}\t {show.rating}\t {show.certificate}\t {show.discontinued}\t  {show.votes}")
+# print why a table has no rows, either there are no results or the requested page is past the end of them
+def print_empty_table(rows: Iterable, limit: int, page: int, no_matches: str) -> None:
+    if limit and page > 1:
+        total = f"{len(rows)} results, " if isinstance(rows, Sized) else ""
+        print(f"Page {page} is empty ({total}{limit} per page)")
     else:
-        print("No matches")
+        print(no_matches)
+
+# print the movies from the list or stream of movies in a table
+def print_movies(movies: Iterable, name_width: int = 0, limit: int = 0, page: int = 1) -> None:
+    if not print_table(movies, format_movie_headings, format_movie_row, name_width, limit, page):
+        print_empty_table(movies, limit, page, "No Matches")
+
+# print the shows from the list or stream of shows in a table
+def print_tv_shows(shows: Iterable, name_width: int = 0, limit: int = 0, page: int = 1) -> None:
+    if not print_table(shows, format_tv_show_headings, format_tv_show_row, name_width, limit, page):
+        print_empty_table(shows, limit, page, "No matches")
 
 def main() -> None:
     args = get_args()
+    output_args = get_output_args()
     scraper = IMDbScraper(*args)
 
     if scraper.genre is None or scraper.genre not in scraper.genres:
@@ -178,7 +255,7 @@ def main() -> None:
 
         # output the results
         print(f"Found {len(movie_results)} matches:\n")
-        print_movies(movie_results)
+        print_movies(movie_results, *output_args)
     elif args[0] == Types.TV_SHOW:
         # print the valid filter options
         filter_options = scraper.get_tv_show_filter_options()
@@ -193,7 +270,7 @@ def main() -> None:
 
         # output the results
         print(f"Found {len(tv_show_results)} matches:\n")
-        print_tv_shows(tv_show_results)
+        print_tv_shows(tv_show_results, *output_args)
 
 
 if __name__ == "__main__":